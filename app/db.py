@@ -1,4 +1,10 @@
+import itertools
 import os
+import queue
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import pyodbc
@@ -8,6 +14,9 @@ from dotenv import load_dotenv
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
+# Driver-manager pooling leaks handles under unixODBC; pool in-process instead.
+pyodbc.pooling = False
+
 
 def _require_env(name: str) -> str:
     value = os.getenv(name, "").strip()
@@ -47,5 +56,122 @@ def build_connection_string() -> str:
     return ";".join(parts)
 
 
-def get_connection() -> pyodbc.Connection:
-    return pyodbc.connect(build_connection_string(), timeout=10)
+_CONN_STR = build_connection_string()
+DB_SERVER = os.getenv("DB_SERVER", "").strip()
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_POOL_PING_AFTER_SECONDS = float(os.getenv("DB_POOL_PING_AFTER_SECONDS", "30"))
+
+
+class PooledConnection:
+    # A pyodbc connection plus the session state tied to it. sp_prepare
+    # handles are numbered per session, so they live and die with the
+    # pooled entry rather than in a side table that could outlive it.
+    __slots__ = ("conn", "prepared", "idle_since")
+
+    def __init__(self, conn: pyodbc.Connection) -> None:
+        self.conn = conn
+        self.prepared: dict[str, int] = {}
+        self.idle_since = 0.0
+
+    def cursor(self) -> pyodbc.Cursor:
+        return self.conn.cursor()
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        self.conn.rollback()
+
+
+_POOL: "queue.Queue[PooledConnection]" = queue.Queue(maxsize=DB_POOL_SIZE)
+
+# No SET NOCOUNT here: it would stick to the pooled session. Count-only
+# results are skipped by the description check in execute_prepared.
+_PREPARE_SQL = (
+    "DECLARE @h int; "
+    "EXEC sp_prepare @h OUTPUT, ?, ?; "
+    "SELECT @h AS prepared_handle"
+)
+
+
+def _named_params(sql: str) -> str:
+    counter = itertools.count(1)
+    return re.sub(r"\?", lambda _: f"@p{next(counter)}", sql)
+
+
+def execute_prepared(
+    conn: PooledConnection, sql: str, param_types: str, *params: object
+) -> pyodbc.Cursor:
+    cur = conn.cursor()
+    handle = conn.prepared.get(sql)
+    if handle is None:
+        cur.execute(_PREPARE_SQL, param_types, _named_params(sql))
+        # sp_prepare may emit the statement's column metadata first.
+        while cur.description is None or cur.description[0][0] != "prepared_handle":
+            if not cur.nextset():
+                raise pyodbc.ProgrammingError("sp_prepare did not return a handle")
+        handle = conn.prepared[sql] = int(cur.fetchone()[0])
+    placeholders = "".join(", ?" for _ in params)
+    cur.execute(f"EXEC sp_execute ?{placeholders}", handle, *params)
+    return cur
+
+
+def _discard(conn: PooledConnection) -> None:
+    try:
+        cur = conn.cursor()
+        for handle in conn.prepared.values():
+            cur.execute("EXEC sp_unprepare ?", handle)
+    except pyodbc.Error:
+        pass
+    conn.prepared.clear()
+    try:
+        conn.conn.close()
+    except pyodbc.Error:
+        pass
+
+
+def _release(conn: PooledConnection) -> None:
+    try:
+        conn.rollback()
+    except pyodbc.Error:
+        _discard(conn)
+        return
+    conn.idle_since = time.monotonic()
+    try:
+        _POOL.put_nowait(conn)
+    except queue.Full:
+        _discard(conn)
+
+
+def _is_alive(conn: PooledConnection) -> bool:
+    try:
+        conn.cursor().execute("SELECT 1").fetchone()
+    except pyodbc.Error:
+        return False
+    return True
+
+
+def _checkout() -> PooledConnection:
+    # Connections idle for a while may have been dropped by a restart,
+    # failover or network timeout; ping those before handing them out.
+    # Recently used ones are trusted so a checkout stays one round trip.
+    while True:
+        try:
+            conn = _POOL.get_nowait()
+        except queue.Empty:
+            return PooledConnection(
+                pyodbc.connect(_CONN_STR, timeout=10, autocommit=False)
+            )
+        if time.monotonic() - conn.idle_since < DB_POOL_PING_AFTER_SECONDS or _is_alive(conn):
+            return conn
+        _discard(conn)
+
+
+@contextmanager
+def get_connection() -> Iterator[PooledConnection]:
+    conn = _checkout()
+    try:
+        yield conn
+    finally:
+        # Anything not committed by the caller is rolled back before reuse.
+        _release(conn)
@@ -1,44 +1,125 @@
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from functools import cache, lru_cache, partial, wraps
 from pathlib import Path
 from typing import Any
-from urllib.parse import quote_plus
+from urllib.parse import urlencode
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-import os
+import asyncio
+import re
+import threading
+import time
 
 import pyodbc
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
-from .db import get_connection
+from .db import DB_POOL_SIZE, DB_SERVER, execute_prepared, get_connection
 
 
-app = FastAPI(title="SQL Server CRUD Viewer")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    prober = asyncio.create_task(_probe_health())
+    try:
+        yield
+    finally:
+        prober.cancel()
+        with suppress(asyncio.CancelledError):
+            await prober
+
+
+app = FastAPI(title="SQL Server CRUD Viewer", lifespan=lifespan)
 templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent / "templates"))
 PAGE_SIZE = 200
+METADATA_TTL_SECONDS = 60
+METADATA_CACHE_MAX_ENTRIES = 1024
+HEALTH_CHECK_INTERVAL_SECONDS = 5
+HEALTH_CHECK_TIMEOUT_SECONDS = 3
+# /health reports down once the last successful probe is older than this.
+HEALTH_STALE_AFTER_SECONDS = 3 * HEALTH_CHECK_INTERVAL_SECONDS
+
+_last_healthy: float | None = None
+
+# Keys include user-supplied schema/table names, so the cache is bounded
+# (least recently used entries go first) and expired entries are dropped.
+_meta_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_meta_lock = threading.Lock()
+
+# pyodbc has no async API; DB calls run here, sized to match the pool.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="db")
+
+
+async def _run_db(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DB_EXECUTOR, partial(func, *args, **kwargs))
+
+
+def _cache_lookup(key: tuple) -> tuple[bool, Any]:
+    now = time.monotonic()
+    with _meta_lock:
+        entry = _meta_cache.get(key)
+        if entry is None:
+            return False, None
+        if now >= entry[0]:
+            del _meta_cache[key]
+            return False, None
+        _meta_cache.move_to_end(key)
+    return True, entry[1]
+
+
+def _cache_store(key: tuple, value: Any, seconds: float) -> None:
+    with _meta_lock:
+        _meta_cache[key] = (time.monotonic() + seconds, value)
+        _meta_cache.move_to_end(key)
+        while len(_meta_cache) > METADATA_CACHE_MAX_ENTRIES:
+            _meta_cache.popitem(last=False)
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = (func.__name__, *args)
+            hit, value = _cache_lookup(key)
+            if hit:
+                return value
+            value = func(*args)
+            _cache_store(key, value, seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_metadata_cache() -> None:
+    with _meta_lock:
+        _meta_cache.clear()
+
+
+@lru_cache(maxsize=4096)
+def _quote_ident(name: str) -> str:
+    return f"[{name.replace(']', ']]')}]"
 
 
 def quote_ident(name: str) -> str:
     if not name:
         raise HTTPException(status_code=400, detail="Invalid identifier")
-    return f"[{name.replace(']', ']]')}]"
+    return _quote_ident(name)
 
 
-def list_tables() -> list[dict[str, str]]:
-    query = """
+_LIST_TABLES_SQL = """
     SELECT TABLE_SCHEMA, TABLE_NAME
     FROM INFORMATION_SCHEMA.TABLES
     WHERE TABLE_TYPE = 'BASE TABLE'
     ORDER BY TABLE_SCHEMA, TABLE_NAME
     """
-    with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute(query)
-        return [{"schema": row[0], "name": row[1]} for row in cur.fetchall()]
 
-
-def table_columns(schema: str, table: str) -> list[dict[str, Any]]:
-    query = """
+_TABLE_COLUMNS_SQL = """
     SELECT
       c.COLUMN_NAME,
       c.DATA_TYPE,
@@ -52,10 +133,39 @@ def table_columns(schema: str, table: str) -> list[dict[str, Any]]:
     WHERE c.TABLE_SCHEMA = ? AND c.TABLE_NAME = ?
     ORDER BY c.ORDINAL_POSITION
     """
-    with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute(query, schema, table)
-        rows = cur.fetchall()
+
+_NAME_PAIR_TYPES = "@p1 nvarchar(128), @p2 nvarchar(128)"
+
+_OBJECT_NAME_TYPES = "@p1 nvarchar(776)"
+
+_PRIMARY_KEY_SQL = """
+    SELECT c.name
+    FROM sys.key_constraints AS kc
+    JOIN sys.index_columns AS ic
+      ON ic.object_id = kc.parent_object_id
+     AND ic.index_id = kc.unique_index_id
+    JOIN sys.columns AS c
+      ON c.object_id = ic.object_id
+     AND c.column_id = ic.column_id
+    WHERE kc.type = 'PK'
+      AND kc.parent_object_id = OBJECT_ID(?)
+    ORDER BY ic.key_ordinal
+    """
+
+# Heap (0) or clustered index (1) partitions hold one entry per row, so
+# this reads the stored row count instead of scanning the table.
+_ROW_COUNT_ESTIMATE_SQL = """
+    SELECT COALESCE(SUM(p.rows), 0)
+    FROM sys.partitions AS p
+    WHERE p.object_id = OBJECT_ID(?) AND p.index_id IN (0, 1)
+    """
+
+
+def _tables_from_rows(rows: list[Any]) -> list[dict[str, str]]:
+    return [{"schema": row[0], "name": row[1]} for row in rows]
+
+
+def _columns_from_rows(rows: list[Any]) -> list[dict[str, Any]]:
     return [
         {
             "name": row[0],
@@ -67,10 +177,40 @@ def table_columns(schema: str, table: str) -> list[dict[str, Any]]:
     ]
 
 
+def _primary_key_from_rows(rows: list[Any]) -> str | None:
+    names = [r[0] for r in rows]
+    if not names:
+        return None
+    if len(names) > 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Composite primary key is not supported yet.",
+        )
+    return names[0]
+
+
+@ttl_cache(seconds=METADATA_TTL_SECONDS)
+def list_tables() -> list[dict[str, str]]:
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(_LIST_TABLES_SQL)
+        return _tables_from_rows(cur.fetchall())
+
+
+@ttl_cache(seconds=METADATA_TTL_SECONDS)
+def table_columns(schema: str, table: str) -> list[dict[str, Any]]:
+    with get_connection() as conn:
+        cur = execute_prepared(conn, _TABLE_COLUMNS_SQL, _NAME_PAIR_TYPES, schema, table)
+        rows = cur.fetchall()
+    return _columns_from_rows(rows)
+
+
 def _error_text(exc: Exception) -> str:
-    if isinstance(exc, pyodbc.Error) and exc.args:
-        return str(exc.args[1] if len(exc.args) > 1 else exc.args[0])
-    return str(exc)
+    # pyodbc errors carry (sqlstate, message); prefer the message.
+    args = getattr(exc, "args", ())
+    if len(args) > 1:
+        return str(args[1])
+    return str(args[0]) if args else str(exc)
 
 
 def _safe_page(value: Any, default: int = 1) -> int:
@@ -81,6 +221,8 @@ def _safe_page(value: Any, default: int = 1) -> int:
         return default
 
 
+# Server, database and instance names are fixed for the process lifetime.
+@cache
 def current_connection_info() -> dict[str, str]:
     query = """
     SELECT
@@ -96,94 +238,92 @@ def current_connection_info() -> dict[str, str]:
         "server_name": row[0],
         "database_name": row[1],
         "instance_name": row[2],
-        "target_server": os.getenv("DB_SERVER", "").strip(),
+        "target_server": DB_SERVER,
     }
 
 
-def table_count(schema: str, table: str) -> int:
-    table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
-    query = f"SELECT COUNT(1) FROM {table_sql}"
-    with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute(query)
-        row = cur.fetchone()
-    return int(row[0] or 0)
+# Only the documented shapes are accepted, also allowing unpadded fields
+# (2024-1-5 9:30). fromisoformat() is deliberately not used: it also takes
+# offsets, week dates and compact forms, and pyodbc silently drops tzinfo.
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})[T ](\d{1,2}):(\d{1,2})(?::(\d{1,2}))?",
+    re.ASCII,
+)
+_THOUSANDS_SEP = str.maketrans("", "", ",")
 
 
 def _parse_datetime(value: str) -> datetime:
-    candidates = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M",
-    ]
-    for fmt in candidates:
+    m = _DATETIME_RE.fullmatch(value)
+    if m:
         try:
-            return datetime.strptime(value, fmt)
+            return datetime(*(int(part or 0) for part in m.groups()))
         except ValueError:
-            continue
+            pass
     raise ValueError("datetime format must be YYYY-MM-DD HH:MM[:SS]")
 
 
 def _parse_date(value: str) -> date:
+    m = _DATE_RE.fullmatch(value)
+    if m:
+        try:
+            return date(*(int(part) for part in m.groups()))
+        except ValueError:
+            pass
+    raise ValueError("date format must be YYYY-MM-DD")
+
+
+def _to_decimal(text: str) -> Decimal:
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
-    except ValueError as exc:
-        raise ValueError("date format must be YYYY-MM-DD") from exc
+        return Decimal(text.translate(_THOUSANDS_SEP))
+    except InvalidOperation as exc:
+        raise ValueError("numeric field must be a number") from exc
 
 
-def normalize_input_value(raw: str, data_type: str) -> Any:
-    text = raw.strip()
-    dt = (data_type or "").lower()
+def _to_bit(text: str) -> bool:
+    lower = text.lower()
+    if lower in {"1", "true", "yes", "y"}:
+        return True
+    if lower in {"0", "false", "no", "n"}:
+        return False
+    raise ValueError("bit field must be true/false or 1/0")
 
-    if dt in {"int", "bigint", "smallint", "tinyint"}:
-        return int(text)
-    if dt in {"decimal", "numeric", "money", "smallmoney"}:
-        normalized = text.replace(",", "")
-        try:
-            return Decimal(normalized)
-        except InvalidOperation as exc:
-            raise ValueError("numeric field must be a number") from exc
-    if dt in {"float", "real"}:
-        return float(text)
-    if dt == "bit":
-        lower = text.lower()
-        if lower in {"1", "true", "yes", "y"}:
-            return True
-        if lower in {"0", "false", "no", "n"}:
-            return False
-        raise ValueError("bit field must be true/false or 1/0")
-    if dt == "date":
-        return _parse_date(text)
-    if dt in {"datetime", "datetime2", "smalldatetime"}:
-        return _parse_datetime(text)
+
+def _identity(text: str) -> str:
     return text
 
 
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "bigint": int,
+    "smallint": int,
+    "tinyint": int,
+    "decimal": _to_decimal,
+    "numeric": _to_decimal,
+    "money": _to_decimal,
+    "smallmoney": _to_decimal,
+    "float": float,
+    "real": float,
+    "bit": _to_bit,
+    "date": _parse_date,
+    "datetime": _parse_datetime,
+    "datetime2": _parse_datetime,
+    "smalldatetime": _parse_datetime,
+}
+
+
+def normalize_input_value(raw: str, data_type: str) -> Any:
+    text = raw.strip()
+    return _CONVERTERS.get((data_type or "").lower(), _identity)(text)
+
+
+@ttl_cache(seconds=METADATA_TTL_SECONDS)
 def table_primary_key(schema: str, table: str) -> str | None:
-    query = """
-    SELECT KU.COLUMN_NAME
-    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS TC
-    JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS KU
-      ON TC.CONSTRAINT_NAME = KU.CONSTRAINT_NAME
-     AND TC.TABLE_SCHEMA = KU.TABLE_SCHEMA
-    WHERE TC.CONSTRAINT_TYPE = 'PRIMARY KEY'
-      AND TC.TABLE_SCHEMA = ?
-      AND TC.TABLE_NAME = ?
-    ORDER BY KU.ORDINAL_POSITION
-    """
+    table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
     with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute(query, schema, table)
-        rows = [r[0] for r in cur.fetchall()]
-    if not rows:
-        return None
-    if len(rows) > 1:
-        raise HTTPException(
-            status_code=400,
-            detail="Composite primary key is not supported yet.",
-        )
-    return rows[0]
+        cur = execute_prepared(conn, _PRIMARY_KEY_SQL, _OBJECT_NAME_TYPES, table_sql)
+        rows = cur.fetchall()
+    return _primary_key_from_rows(rows)
 
 
 def table_rows(
@@ -193,57 +333,147 @@ def table_rows(
     limit: int = PAGE_SIZE,
     offset: int = 0,
     order_column: str | None = None,
-) -> list[dict[str, Any]]:
+) -> list[pyodbc.Row]:
     if not cols:
         return []
     sort_col = order_column or cols[0]["name"]
+    # Select the columns explicitly so row positions always line up with cols.
+    select_sql = ", ".join(quote_ident(c["name"]) for c in cols)
     table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
     query = (
-        f"SELECT * FROM {table_sql} "
+        f"SELECT {select_sql} FROM {table_sql} "
         f"ORDER BY {quote_ident(sort_col)} "
         "OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
     )
     with get_connection() as conn:
         cur = conn.cursor()
         cur.execute(query, int(offset), int(limit))
-        rows = cur.fetchall()
-    col_names = [c["name"] for c in cols]
-    return [dict(zip(col_names, row)) for row in rows]
+        cur.arraysize = max(1, min(int(limit), 1000))
+        rows: list[pyodbc.Row] = []
+        while True:
+            chunk = cur.fetchmany(cur.arraysize)
+            if not chunk:
+                break
+            rows.extend(chunk)
+        return rows
+
+
+def home_bundle(schema: str, table: str) -> dict[str, Any]:
+    # One batch for everything the page header needs; cached metadata is
+    # left out of the batch and only the row count is always fetched.
+    table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
+    metadata = [
+        ("tables", ("list_tables",), _LIST_TABLES_SQL, (), _tables_from_rows),
+        ("columns", ("table_columns", schema, table), _TABLE_COLUMNS_SQL, (schema, table), _columns_from_rows),
+        ("pk_column", ("table_primary_key", schema, table), _PRIMARY_KEY_SQL, (table_sql,), _primary_key_from_rows),
+    ]
+    bundle: dict[str, Any] = {}
+    pending = []
+    statements: list[str] = []
+    params: list[Any] = []
+    for name, key, sql, sql_params, parse in metadata:
+        hit, value = _cache_lookup(key)
+        if hit:
+            bundle[name] = value
+            continue
+        pending.append((name, key, parse))
+        statements.append(sql)
+        params.extend(sql_params)
+    statements.append(_ROW_COUNT_ESTIMATE_SQL)
+    params.append(table_sql)
+
+    results: list[list[Any]] = []
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(";\n".join(statements), *params)
+        while True:
+            # Only SELECT results count; row-count-only results are skipped
+            # rather than hidden with SET NOCOUNT, which outlives the batch.
+            if cur.description is not None:
+                results.append(cur.fetchall())
+            if not cur.nextset():
+                break
+
+    for (name, key, parse), rows in zip(pending, results):
+        bundle[name] = parse(rows)
+        _cache_store(key, bundle[name], METADATA_TTL_SECONDS)
+    bundle["total_rows"] = int(results[-1][0][0] or 0)
+    return bundle
+
+
+def _table_redirect(schema: str, table: str, page: int) -> RedirectResponse:
+    query = urlencode({"schema": schema, "table": table, "page": page})
+    return RedirectResponse(url=f"/?{query}", status_code=303)
+
+
+def _error_redirect(schema: str, table: str, page: int, msg: str) -> RedirectResponse:
+    query = urlencode({"schema": schema, "table": table, "page": page, "error": msg})
+    return RedirectResponse(url=f"/?{query}", status_code=303)
+
+
+def _execute_write(query: str, params: Sequence[Any]) -> None:
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(query, *params)
+        conn.commit()
+
+
+def _execute_write_many(query: str, rows: Sequence[Sequence[Any]]) -> None:
+    with get_connection() as conn:
+        cur = conn.cursor()
+        # Bind every row in one parameter array instead of one RPC per row.
+        cur.fast_executemany = True
+        cur.executemany(query, rows)
+        conn.commit()
+
+
+def _ping() -> None:
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+        cur.fetchone()
 
 
 @app.get("/", response_class=HTMLResponse)
-def home(
+async def home(
     request: Request,
     schema: str | None = None,
     table: str | None = None,
     page: str | None = None,
 ):
-    tables = list_tables()
-    connection = current_connection_info()
+    tables: list[dict[str, str]] = []
+    connection = await _run_db(current_connection_info)
     current_page = _safe_page(page, 1)
     selected_schema = schema
     selected_table = table
     columns: list[dict[str, Any]] = []
-    rows: list[dict[str, Any]] = []
+    rows: list[pyodbc.Row] = []
     total_rows = 0
     total_pages = 1
     row_start = 0
     row_end = 0
     pk_column: str | None = None
+    pk_index: int | None = None
     error_message: str | None = request.query_params.get("error")
 
     if schema and table:
         try:
-            columns = table_columns(schema, table)
+            bundle = await _run_db(home_bundle, schema, table)
+            tables = bundle["tables"]
+            columns = bundle["columns"]
             if not columns:
                 raise HTTPException(status_code=404, detail="Table not found")
-            pk_column = table_primary_key(schema, table)
-            total_rows = table_count(schema, table)
+            pk_column = bundle["pk_column"]
+            pk_index = next(
+                (i for i, c in enumerate(columns) if c["name"] == pk_column), None
+            )
+            total_rows = bundle["total_rows"]
             total_pages = max(1, (total_rows + PAGE_SIZE - 1) // PAGE_SIZE)
             current_page = min(current_page, total_pages)
             offset = (current_page - 1) * PAGE_SIZE
             order_column = pk_column or columns[0]["name"]
-            rows = table_rows(
+            rows = await _run_db(
+                table_rows,
                 schema,
                 table,
                 cols=columns,
@@ -256,6 +486,8 @@ def home(
                 row_end = min(offset + len(rows), total_rows)
         except Exception as exc:  # pragma: no cover
             error_message = str(exc)
+    if not tables:
+        tables = await _run_db(list_tables)
 
     return templates.TemplateResponse(
         request,
@@ -276,6 +508,7 @@ def home(
             "has_prev": current_page > 1,
             "has_next": current_page < total_pages,
             "pk_column": pk_column,
+            "pk_index": pk_index,
             "error_message": error_message,
         },
     )
@@ -285,10 +518,14 @@ def home(
 async def insert_row(schema: str, table: str, request: Request):
     form = await request.form()
     current_page = _safe_page(form.get("_page"), 1)
-    cols = table_columns(schema, table)
+    cols = await _run_db(table_columns, schema, table)
     if not cols:
         raise HTTPException(status_code=404, detail="Table not found")
 
+    insert_cols = [c for c in cols if not c.get("is_identity") and c["name"] in form]
+    if any(len(form.getlist(c["name"])) > 1 for c in insert_cols):
+        return await _insert_many(schema, table, insert_cols, form, current_page)
+
     values: dict[str, Any] = {}
     for col in cols:
         name = col["name"]
@@ -301,12 +538,8 @@ async def insert_row(schema: str, table: str, request: Request):
             try:
                 values[name] = normalize_input_value(raw, str(col.get("data_type", "")))
             except Exception as exc:
-                return RedirectResponse(
-                    url=(
-                        f"/?schema={schema}&table={table}&page={current_page}"
-                        f"&error={quote_plus(f'Invalid value for {name}: {exc}')}"
-                    ),
-                    status_code=303,
+                return _error_redirect(
+                    schema, table, current_page, f"Invalid value for {name}: {exc}"
                 )
 
     if not values:
@@ -318,29 +551,68 @@ async def insert_row(schema: str, table: str, request: Request):
     query = f"INSERT INTO {table_sql} ({columns_sql}) VALUES ({placeholders})"
 
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(query, *values.values())
-            conn.commit()
+        await _run_db(_execute_write, query, list(values.values()))
     except Exception as exc:
-        return RedirectResponse(
-            url=(
-                f"/?schema={schema}&table={table}&page={current_page}"
-                f"&error={quote_plus(_error_text(exc))}"
-            ),
-            status_code=303,
-        )
+        return _error_redirect(schema, table, current_page, _error_text(exc))
 
-    return RedirectResponse(
-        url=f"/?schema={schema}&table={table}&page={current_page}",
-        status_code=303,
-    )
+    return _table_redirect(schema, table, current_page)
+
+
+async def _insert_many(
+    schema: str,
+    table: str,
+    cols: list[dict[str, Any]],
+    form: Any,
+    current_page: int,
+) -> RedirectResponse:
+    # Repeated field names post several rows at once; a blank cell is NULL
+    # and a column left blank in every row is omitted entirely.
+    raw_columns = {c["name"]: [str(v).strip() for v in form.getlist(c["name"])] for c in cols}
+    row_count = max(len(v) for v in raw_columns.values())
+    used_cols = [c for c in cols if any(raw_columns[c["name"]])]
+    if not used_cols:
+        raise HTTPException(status_code=400, detail="No values to insert")
+    for col in used_cols:
+        if len(raw_columns[col["name"]]) != row_count:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Column {col['name']} must have {row_count} values",
+            )
+
+    rows: list[tuple[Any, ...]] = []
+    for index in range(row_count):
+        row: list[Any] = []
+        for col in used_cols:
+            name = col["name"]
+            raw = raw_columns[name][index]
+            if raw == "":
+                row.append(None)
+                continue
+            try:
+                row.append(normalize_input_value(raw, str(col.get("data_type", ""))))
+            except Exception as exc:
+                return _error_redirect(
+                    schema, table, current_page, f"Invalid value for {name} (row {index + 1}): {exc}"
+                )
+        rows.append(tuple(row))
+
+    columns_sql = ", ".join(quote_ident(c["name"]) for c in used_cols)
+    placeholders = ", ".join("?" for _ in used_cols)
+    table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
+    query = f"INSERT INTO {table_sql} ({columns_sql}) VALUES ({placeholders})"
+
+    try:
+        await _run_db(_execute_write_many, query, rows)
+    except Exception as exc:
+        return _error_redirect(schema, table, current_page, _error_text(exc))
+
+    return _table_redirect(schema, table, current_page)
 
 
 @app.post("/table/{schema}/{table}/update/{pk_value}")
 async def update_row(schema: str, table: str, pk_value: str, request: Request):
-    cols = table_columns(schema, table)
-    pk_col = table_primary_key(schema, table)
+    cols = await _run_db(table_columns, schema, table)
+    pk_col = await _run_db(table_primary_key, schema, table)
     if not cols or not pk_col:
         raise HTTPException(status_code=400, detail="Table or primary key not found")
 
@@ -358,12 +630,8 @@ async def update_row(schema: str, table: str, pk_value: str, request: Request):
             try:
                 set_values[key] = normalize_input_value(raw, str(col_map[key].get("data_type", "")))
             except Exception as exc:
-                return RedirectResponse(
-                    url=(
-                        f"/?schema={schema}&table={table}&page={current_page}"
-                        f"&error={quote_plus(f'Invalid value for {key}: {exc}')}"
-                    ),
-                    status_code=303,
+                return _error_redirect(
+                    schema, table, current_page, f"Invalid value for {key}: {exc}"
                 )
 
     if not set_values:
@@ -378,28 +646,16 @@ async def update_row(schema: str, table: str, pk_value: str, request: Request):
     )
 
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(query, *set_values.values(), pk_value)
-            conn.commit()
+        await _run_db(_execute_write, query, [*set_values.values(), pk_value])
     except Exception as exc:
-        return RedirectResponse(
-            url=(
-                f"/?schema={schema}&table={table}&page={current_page}"
-                f"&error={quote_plus(_error_text(exc))}"
-            ),
-            status_code=303,
-        )
+        return _error_redirect(schema, table, current_page, _error_text(exc))
 
-    return RedirectResponse(
-        url=f"/?schema={schema}&table={table}&page={current_page}",
-        status_code=303,
-    )
+    return _table_redirect(schema, table, current_page)
 
 
 @app.post("/table/{schema}/{table}/delete/{pk_value}")
-def delete_row(schema: str, table: str, pk_value: str, page: str | None = None):
-    pk_col = table_primary_key(schema, table)
+async def delete_row(schema: str, table: str, pk_value: str, page: str | None = None):
+    pk_col = await _run_db(table_primary_key, schema, table)
     current_page = _safe_page(page, 1)
     if not pk_col:
         raise HTTPException(status_code=400, detail="Primary key not found")
@@ -407,29 +663,46 @@ def delete_row(schema: str, table: str, pk_value: str, page: str | None = None):
     table_sql = f"{quote_ident(schema)}.{quote_ident(table)}"
     query = f"DELETE FROM {table_sql} WHERE {quote_ident(pk_col)} = ?"
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(query, pk_value)
-            conn.commit()
+        await _run_db(_execute_write, query, [pk_value])
     except Exception as exc:
-        return RedirectResponse(
-            url=(
-                f"/?schema={schema}&table={table}&page={current_page}"
-                f"&error={quote_plus(_error_text(exc))}"
-            ),
-            status_code=303,
-        )
+        return _error_redirect(schema, table, current_page, _error_text(exc))
 
-    return RedirectResponse(
-        url=f"/?schema={schema}&table={table}&page={current_page}",
-        status_code=303,
-    )
+    return _table_redirect(schema, table, current_page)
+
+
+@app.post("/cache/invalidate")
+def invalidate_cache(schema: str | None = None, table: str | None = None):
+    invalidate_metadata_cache()
+    current_connection_info.cache_clear()
+    if schema and table:
+        return _table_redirect(schema, table, 1)
+    return RedirectResponse(url="/", status_code=303)
+
+
+async def _probe_health() -> None:
+    # /health serves this cached result instead of querying on every hit.
+    global _last_healthy
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future | None = None
+    while True:
+        # A hung ping keeps its executor thread; don't stack more behind it.
+        if pending is None or pending.done():
+            pending = loop.run_in_executor(_DB_EXECUTOR, _ping)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(pending), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+            )
+            _last_healthy = time.monotonic()
+        except Exception:
+            pass
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
 
 
 @app.get("/health")
-def health():
-    with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT 1")
-        cur.fetchone()
-    return {"status": "ok"}
+async def health():
+    if (
+        _last_healthy is not None
+        and time.monotonic() - _last_healthy < HEALTH_STALE_AFTER_SECONDS
+    ):
+        return {"status": "ok"}
+    return JSONResponse({"status": "down"}, status_code=503)